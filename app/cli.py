@@ -27,6 +27,8 @@ def _print_help() -> None:
                 "  REQUIRE_MODELS_PRESENT=1",
                 "  WHISPER_FP16=auto|0|1",
                 "  DIARIZATION=0",
+                "  PROGRESS_INTERVAL=30",
+                "  STATUS_FILE=",
             ]
         )
     )
@@ -64,6 +64,8 @@ class Settings:
     verbose: bool
     overwrite: bool
     keep_intermediate: bool
+    status_file: Path | None
+    progress_interval: int
 
     @staticmethod
     def from_env(env: Mapping[str, str] | None = None) -> "Settings":
@@ -102,6 +104,11 @@ class Settings:
         verbose = _getenv_bool(env, "VERBOSE", False)
         overwrite = _getenv_bool(env, "OVERWRITE", False)
         keep_intermediate = _getenv_bool(env, "KEEP_INTERMEDIATE", False)
+        status_file_raw = _getenv(env, "STATUS_FILE", "")
+        status_file = Path(status_file_raw) if status_file_raw else None
+        progress_interval = _getenv_int(env, "PROGRESS_INTERVAL", 30)
+        if progress_interval is None or progress_interval <= 0:
+            raise ConfigError("PROGRESS_INTERVAL must be a positive integer")
 
         return Settings(
             input_dir=input_dir,
@@ -119,4 +126,6 @@ class Settings:
             verbose=verbose,
             overwrite=overwrite,
             keep_intermediate=keep_intermediate,
+            status_file=status_file,
+            progress_interval=progress_interval,
         )
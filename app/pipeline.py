@@ -9,6 +9,7 @@ from app.errors import ConfigError, DocxConversionError, ModelNotFoundError, NoI
 from app.file_scan import scan_media_files
 from app.log import log_info
 from app.model_check import ensure_model_present
+from app.progress import BatchProgress
 from app.whisper_runner import run_whisper_txt
 
 
@@ -25,6 +26,12 @@ def _ensure_dirs(settings: Settings) -> None:
             )
 
 
+def _final_path(settings: Settings, src: Path) -> Path:
+    rel = src.relative_to(settings.input_dir)
+    suffix = ".docx" if settings.output_format == "docx" else ".txt"
+    return settings.output_dir / rel.parent / f"{src.stem}{suffix}"
+
+
 def run_pipeline(settings: Settings) -> None:
     _ensure_dirs(settings)
 
@@ -42,49 +49,75 @@ def run_pipeline(settings: Settings) -> None:
     if not media_files:
         raise NoInputFilesError(f"no input media files found under {settings.input_dir}")
 
-    whisper_failures: list[str] = []
-    docx_failures: list[str] = []
-
+    # Inputs sharing a stem map to the same output; without OVERWRITE the first one in sorted order
+    # wins, as if the existence check ran after each earlier file was written.
+    pending: list[Path] = []
+    claimed: set[Path] = set()
     for src in media_files:
-        rel = src.relative_to(settings.input_dir)
-        out_dir = settings.output_dir / rel.parent
-        out_dir.mkdir(parents=True, exist_ok=True)
-
-        txt_path = out_dir / f"{src.stem}.txt"
-        docx_path = out_dir / f"{src.stem}.docx"
-        final_path = docx_path if settings.output_format == "docx" else txt_path
-
-        if final_path.exists() and not settings.overwrite:
+        final_path = _final_path(settings, src)
+        if not settings.overwrite and (final_path in claimed or final_path.exists()):
             log_info("skip", f"exists: {final_path}")
             continue
+        claimed.add(final_path)
+        pending.append(src)
 
-        log_info("file", str(rel))
+    progress = BatchProgress.for_files(
+        files=pending,
+        status_path=settings.status_file,
+        interval=settings.progress_interval,
+    )
 
-        try:
-            run_whisper_txt(
-                input_path=src,
-                output_dir=out_dir,
-                settings=settings,
-            )
-        except WhisperFailedError as exc:
-            whisper_failures.append(f"{rel}: {exc}")
-            continue
+    whisper_failures: list[str] = []
+    docx_failures: list[str] = []
+
+    outcome = "aborted"
+    try:
+        for src in pending:
+            rel = src.relative_to(settings.input_dir)
+            out_dir = settings.output_dir / rel.parent
+            out_dir.mkdir(parents=True, exist_ok=True)
 
-        if settings.output_format == "docx":
+            txt_path = out_dir / f"{src.stem}.txt"
+            docx_path = out_dir / f"{src.stem}.docx"
+
+            log_info("file", str(rel))
+
+            progress.start_file(src, label=str(rel))
             try:
-                txt_to_docx(txt_path=txt_path, docx_path=docx_path, title=src.name)
-                if not settings.keep_intermediate:
-                    try:
-                        txt_path.unlink(missing_ok=True)
-                    except Exception as exc:
-                        raise DocxConversionError(f"failed to remove intermediate txt: {txt_path} ({exc})")
-            except DocxConversionError as exc:
-                docx_failures.append(f"{rel}: {exc}")
-                continue
-            except Exception as exc:
-                docx_failures.append(f"{rel}: docx conversion failed: {exc}")
+                run_whisper_txt(
+                    input_path=src,
+                    output_dir=out_dir,
+                    settings=settings,
+                    progress=progress,
+                )
+            except WhisperFailedError as exc:
+                progress.finish_file(failed=True)
+                whisper_failures.append(f"{rel}: {exc}")
                 continue
 
+            if settings.output_format == "docx":
+                try:
+                    txt_to_docx(txt_path=txt_path, docx_path=docx_path, title=src.name)
+                    if not settings.keep_intermediate:
+                        try:
+                            txt_path.unlink(missing_ok=True)
+                        except Exception as exc:
+                            raise DocxConversionError(f"failed to remove intermediate txt: {txt_path} ({exc})")
+                except DocxConversionError as exc:
+                    progress.finish_file(failed=True)
+                    docx_failures.append(f"{rel}: {exc}")
+                    continue
+                except Exception as exc:
+                    progress.finish_file(failed=True)
+                    docx_failures.append(f"{rel}: docx conversion failed: {exc}")
+                    continue
+
+            progress.finish_file(failed=False)
+
+        outcome = "failed" if whisper_failures or docx_failures else "done"
+    finally:
+        progress.finish(state=outcome)
+
     if whisper_failures:
         message = "some files failed (whisper):\n" + "\n".join(whisper_failures)
         if docx_failures:
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.log import log_info
+
+
+# Segment lines printed by `whisper --verbose True`, e.g. "[01:02.500 --> 01:07.000]  text"
+# (hours are only included once the timestamp reaches one hour).
+_SEGMENT_RE = re.compile(r"^\[((?:\d+:)?\d+:\d+(?:\.\d+)?) --> ((?:\d+:)?\d+:\d+(?:\.\d+)?)\]")
+
+
+def parse_segment_end(line: str) -> float | None:
+    match = _SEGMENT_RE.match(line.strip())
+    if match is None:
+        return None
+    seconds = 0.0
+    for part in match.group(2).split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def probe_duration(path: Path) -> float | None:
+    try:
+        proc = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-show_entries",
+                "format=duration",
+                "-of",
+                "default=noprint_wrappers=1:nokey=1",
+                str(path),
+            ],
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except OSError:
+        return None
+    if proc.returncode != 0:
+        return None
+    try:
+        duration = float((proc.stdout or "").strip().splitlines()[0])
+    except (IndexError, ValueError):
+        return None
+    return duration if duration > 0 else None
+
+
+def _format_hms(seconds: float) -> str:
+    total = int(round(seconds))
+    hours, rest = divmod(total, 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+def _round(value: float | None, ndigits: int) -> float | None:
+    return None if value is None else round(value, ndigits)
+
+
+class BatchProgress:
+    """Tracks decoded audio position across a batch and reports percent, realtime factor and ETA.
+
+    Progress is logged every `interval` seconds from a background heartbeat, independent of whisper
+    output, and mirrored to `status_path` (if set) as JSON.
+    """
+
+    def __init__(self, *, durations: dict[Path, float | None], status_path: Path | None, interval: int) -> None:
+        self._durations = durations
+        self._status_path = status_path
+        self._interval = interval
+        self._started = time.monotonic()
+        self._files_done = 0
+        self._files_failed = 0
+        self._decoded_done = 0.0
+        self._remaining_audio = sum(d for d in durations.values() if d is not None)
+        self._total_audio = self._remaining_audio
+        self._current: Path | None = None
+        self._current_label = ""
+        self._file_started = self._started
+        self._position = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat: threading.Thread | None = None
+
+    @staticmethod
+    def for_files(*, files: list[Path], status_path: Path | None, interval: int) -> "BatchProgress":
+        if files:
+            log_info("progress", f"probing durations of {len(files)} files")
+        return BatchProgress(
+            durations={path: probe_duration(path) for path in files},
+            status_path=status_path,
+            interval=interval,
+        )
+
+    def start_file(self, path: Path, *, label: str) -> None:
+        with self._lock:
+            self._current = path
+            self._current_label = label
+            self._file_started = time.monotonic()
+            self._position = 0.0
+            self._write_status(state="running")
+
+        if self._heartbeat is None:
+            self._heartbeat = threading.Thread(target=self._run_heartbeat, name="progress", daemon=True)
+            self._heartbeat.start()
+
+    def restart_file(self) -> None:
+        # The current file is being decoded again (e.g. fp16 fallback): position and file clock start over.
+        with self._lock:
+            if self._current is None:
+                return
+            self._file_started = time.monotonic()
+            self._position = 0.0
+            self._write_status(state="running")
+
+    def update(self, position: float) -> None:
+        with self._lock:
+            duration = self._durations.get(self._current) if self._current is not None else None
+            if duration is not None:
+                position = min(position, duration)
+            self._position = max(self._position, position)
+
+    def finish_file(self, *, failed: bool) -> None:
+        with self._lock:
+            if self._current is None:
+                return
+            duration = self._durations.get(self._current)
+            self._decoded_done += duration if duration is not None and not failed else self._position
+            if duration is not None:
+                self._remaining_audio = max(0.0, self._remaining_audio - duration)
+            if failed:
+                self._files_failed += 1
+            else:
+                self._files_done += 1
+            self._current = None
+            self._current_label = ""
+            self._position = 0.0
+            self._write_status(state="running")
+
+    def finish(self, *, state: str) -> None:
+        """Stops the heartbeat and records the terminal state: "done", "failed" or "aborted"."""
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+        with self._lock:
+            self._write_status(state=state)
+
+    def _run_heartbeat(self) -> None:
+        # Emits even when whisper prints nothing (model loading, a stalled decode), so a growing
+        # `elapsed` with an unchanged `pos` is visible as a stall rather than as silence.
+        while not self._stop.wait(self._interval):
+            with self._lock:
+                if self._current is not None:
+                    self._emit()
+
+    def _snapshot(self) -> dict[str, float | None]:
+        now = time.monotonic()
+        duration = self._durations.get(self._current) if self._current is not None else None
+        file_elapsed = now - self._file_started if self._current is not None else None
+        file_position = self._position if self._current is not None else None
+        file_percent = min(100.0, self._position / duration * 100) if duration else None
+        file_rtf = file_elapsed / self._position if file_elapsed is not None and self._position > 0 else None
+
+        decoded = self._decoded_done + self._position
+        elapsed = now - self._started
+        batch_rtf = elapsed / decoded if decoded > 0 else None
+        remaining = max(0.0, self._remaining_audio - (self._position if duration is not None else 0.0))
+        batch_percent = (1 - remaining / self._total_audio) * 100 if self._total_audio > 0 else None
+        eta = remaining * batch_rtf if batch_rtf is not None else None
+
+        return {
+            "file_elapsed_seconds": file_elapsed,
+            "file_position_seconds": file_position,
+            "file_duration_seconds": duration,
+            "file_percent": file_percent,
+            "file_realtime_factor": file_rtf,
+            "batch_percent": batch_percent,
+            "realtime_factor": batch_rtf,
+            "remaining_audio_seconds": remaining,
+            "eta_seconds": eta,
+            "elapsed_seconds": elapsed,
+        }
+
+    def _emit(self) -> None:
+        snap = self._snapshot()
+        percent = snap["file_percent"]
+        rtf = snap["file_realtime_factor"]
+        eta = snap["eta_seconds"]
+        log_info(
+            "progress",
+            self._current_label,
+            f"{percent:.1f}%" if percent is not None else "?%",
+            f"pos={_format_hms(self._position)}",
+            f"elapsed={_format_hms(snap['file_elapsed_seconds'])}",
+            f"rtf={rtf:.2f}" if rtf is not None else "rtf=?",
+            f"batch_eta={_format_hms(eta)}" if eta is not None else "batch_eta=?",
+        )
+        self._write_status(state="running", snapshot=snap)
+
+    def _write_status(self, *, state: str, snapshot: dict[str, float | None] | None = None) -> None:
+        if self._status_path is None:
+            return
+        snap = snapshot if snapshot is not None else self._snapshot()
+        status = {
+            "state": state,
+            "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "files_total": len(self._durations),
+            "files_done": self._files_done,
+            "files_failed": self._files_failed,
+            "current_file": self._current_label or None,
+            "file_elapsed_seconds": _round(snap["file_elapsed_seconds"], 0),
+            "file_position_seconds": _round(snap["file_position_seconds"], 1),
+            "file_duration_seconds": _round(snap["file_duration_seconds"], 1),
+            "file_percent": _round(snap["file_percent"], 1),
+            "file_realtime_factor": _round(snap["file_realtime_factor"], 3),
+            "batch_percent": _round(snap["batch_percent"], 1),
+            "realtime_factor": _round(snap["realtime_factor"], 3),
+            "remaining_audio_seconds": _round(snap["remaining_audio_seconds"], 1),
+            "eta_seconds": _round(snap["eta_seconds"], 0),
+            "elapsed_seconds": _round(snap["elapsed_seconds"], 0),
+        }
+        tmp_path = self._status_path.with_name(f".{self._status_path.name}.tmp")
+        try:
+            self._status_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(status, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            os.replace(tmp_path, self._status_path)
+        except OSError as exc:
+            # Monitoring must never break transcription; report once and stop writing.
+            log_info("progress", f"status file disabled: {self._status_path} ({exc})")
+            self._status_path = None
@@ -1,17 +1,28 @@
 from __future__ import annotations
 
+import os
 import subprocess
+import sys
+from collections import deque
 from pathlib import Path
 
 from app.config import Settings
 from app.errors import WhisperFailedError
 from app.log import log_info
+from app.progress import BatchProgress, parse_segment_end
 
 
 _CUDA_FP16_FORCE_FP32 = False
+_OUTPUT_TAIL_LINES = 50
 
 
-def run_whisper_txt(*, input_path: Path, output_dir: Path, settings: Settings) -> None:
+def run_whisper_txt(
+    *,
+    input_path: Path,
+    output_dir: Path,
+    settings: Settings,
+    progress: BatchProgress | None = None,
+) -> None:
     expected_txt_path = output_dir / f"{input_path.stem}.txt"
 
     def _build_cmd(*, fp16: bool | None) -> list[str]:
@@ -30,8 +41,9 @@ def run_whisper_txt(*, input_path: Path, output_dir: Path, settings: Settings) -
         settings.whisper_task,
         "--device",
         settings.whisper_device,
+        # Always request per-segment output: the segment timestamps drive progress reporting.
         "--verbose",
-        "True" if settings.verbose else "False",
+        "True",
         ]
 
         resolved_fp16 = fp16
@@ -50,37 +62,48 @@ def run_whisper_txt(*, input_path: Path, output_dir: Path, settings: Settings) -
 
     def _run_once(*, fp16: bool | None) -> tuple[int, str]:
         cmd = _build_cmd(fp16=fp16)
-        if settings.verbose:
-            proc = subprocess.run(cmd, check=False)
-            return proc.returncode, ""
-
-        proc = subprocess.run(
+        if progress is not None:
+            progress.restart_file()
+
+        # Stream output instead of capturing it so long files report progress as they go;
+        # only the last non-transcript lines are kept for error messages.
+        tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+        env = {**os.environ, "PYTHONUNBUFFERED": "1", "PYTHONIOENCODING": "utf-8"}
+        with subprocess.Popen(
             cmd,
-            check=False,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
-        )
-        return proc.returncode, (proc.stdout or "")
-
-    def _raise_failed(*, exit_code: int, output: str) -> None:
+            encoding="utf-8",
+            errors="replace",
+            env=env,
+        ) as proc:
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                if settings.verbose:
+                    sys.stdout.write(line)
+                    sys.stdout.flush()
+                position = parse_segment_end(line)
+                if position is None:
+                    tail.append(line.rstrip("\n"))
+                elif progress is not None:
+                    progress.update(position)
+            exit_code = proc.wait()
+        return exit_code, "\n".join(tail)
+
+    def _failure_detail(output: str) -> str:
         out = output.strip()
-        tail = "\n".join(out.splitlines()[-50:]) if out else ""
-        detail = f"\n{tail}" if tail else ""
-        hint = ""
+        detail = f"\n{out}" if out else ""
         if settings.whisper_device == "cuda":
-            hint = "\nHint: try setting WHISPER_FP16=0 (some GPUs/drivers produce NaNs with fp16)."
-        raise WhisperFailedError(f"whisper failed for {input_path} (exit={exit_code}){detail}{hint}")
+            detail += "\nHint: try setting WHISPER_FP16=0 (some GPUs/drivers produce NaNs with fp16)."
+        return detail
+
+    def _raise_failed(*, exit_code: int, output: str) -> None:
+        raise WhisperFailedError(f"whisper failed for {input_path} (exit={exit_code}){_failure_detail(output)}")
 
     def _raise_no_output(*, output: str) -> None:
-        out = output.strip()
-        tail = "\n".join(out.splitlines()[-50:]) if out else ""
-        detail = f"\n{tail}" if tail else ""
-        hint = ""
-        if settings.whisper_device == "cuda":
-            hint = "\nHint: try setting WHISPER_FP16=0 (some GPUs/drivers produce NaNs with fp16)."
         raise WhisperFailedError(
-            f"whisper produced no output for {input_path} (expected: {expected_txt_path}){detail}{hint}"
+            f"whisper produced no output for {input_path} (expected: {expected_txt_path}){_failure_detail(output)}"
         )
 
     global _CUDA_FP16_FORCE_FP32
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+from unittest import mock
+
+from app.config import Settings
+from app.errors import DocxConversionError, WhisperFailedError
+from app.pipeline import run_pipeline
+from app.progress import BatchProgress, parse_segment_end
+
+
+class ParseSegmentEndTest(unittest.TestCase):
+    def test_minutes_seconds(self) -> None:
+        self.assertEqual(parse_segment_end("[00:01.000 --> 01:07.500]  hello\n"), 67.5)
+
+    def test_hours_minutes_seconds(self) -> None:
+        self.assertEqual(parse_segment_end("[59:58.000 --> 1:02:03.250]  hello"), 3723.25)
+
+    def test_non_segment_lines(self) -> None:
+        for line in ["", "Detecting language using up to the first 30 seconds.", "Detected language: English", "hello [00:01.000 --> 00:02.000]"]:
+            self.assertIsNone(parse_segment_end(line))
+
+
+class BatchProgressTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.status_path = Path(tmp.name) / "status.json"
+        self.a = Path("a.wav")
+        self.b = Path("b.wav")
+        self.progress = BatchProgress(
+            durations={self.a: 30.0, self.b: 60.0},
+            status_path=self.status_path,
+            interval=3600,
+        )
+
+    def _status(self) -> dict:
+        return json.loads(self.status_path.read_text(encoding="utf-8"))
+
+    def test_update_clamps_to_duration_and_never_goes_back(self) -> None:
+        self.progress.start_file(self.a, label="a.wav")
+        self.progress.update(45.0)
+        self.assertEqual(self.progress._snapshot()["file_position_seconds"], 30.0)
+        self.progress.update(10.0)
+        self.assertEqual(self.progress._snapshot()["file_position_seconds"], 30.0)
+        self.progress.finish(state="aborted")
+
+    def test_restart_file_resets_position(self) -> None:
+        self.progress.start_file(self.a, label="sub/a.wav")
+        self.progress.update(20.0)
+        self.progress.restart_file()
+        self.assertEqual(self.progress._snapshot()["file_position_seconds"], 0.0)
+        self.assertEqual(self._status()["current_file"], "sub/a.wav")
+        self.progress.finish(state="aborted")
+
+    def test_finish_file_accounting(self) -> None:
+        self.progress.start_file(self.a, label="a.wav")
+        self.progress.update(10.0)
+        self.progress.finish_file(failed=True)
+        self.assertEqual(self.progress._decoded_done, 10.0)
+
+        self.progress.start_file(self.b, label="b.wav")
+        self.progress.update(60.0)
+        self.progress.finish_file(failed=False)
+        self.assertEqual(self.progress._decoded_done, 70.0)
+
+        self.progress.finish(state="failed")
+        status = self._status()
+        self.assertEqual(status["state"], "failed")
+        self.assertEqual(status["files_total"], 2)
+        self.assertEqual(status["files_done"], 1)
+        self.assertEqual(status["files_failed"], 1)
+        self.assertEqual(status["remaining_audio_seconds"], 0.0)
+        self.assertEqual(status["batch_percent"], 100.0)
+        self.assertIsNone(status["current_file"])
+        self.assertIsNone(status["file_elapsed_seconds"])
+        self.assertIsNone(status["file_position_seconds"])
+
+
+class PipelineProgressTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        self.input_dir = root / "in"
+        self.input_dir.mkdir()
+        self.status_path = root / "status.json"
+        self.settings = Settings.from_env(
+            {
+                "INPUT_DIR": str(self.input_dir),
+                "OUTPUT_DIR": str(root / "out"),
+                "MODEL_DIR": str(root / "models"),
+                "REQUIRE_MODELS_PRESENT": "0",
+                "STATUS_FILE": str(self.status_path),
+            }
+        )
+        self.transcribed: list[str] = []
+        for patcher in [
+            mock.patch("app.pipeline.ensure_model_present"),
+            mock.patch("app.pipeline.run_whisper_txt", side_effect=self._fake_whisper),
+            mock.patch("app.progress.probe_duration", return_value=30.0),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _fake_whisper(self, *, input_path: Path, output_dir: Path, settings: Settings, progress: BatchProgress) -> None:
+        self.transcribed.append(input_path.name)
+        if input_path.stem == "bad":
+            raise WhisperFailedError(f"whisper failed for {input_path}")
+        progress.update(30.0)
+        (output_dir / f"{input_path.stem}.txt").write_text(f"text from {input_path.name}", encoding="utf-8")
+
+    def _status(self) -> dict:
+        return json.loads(self.status_path.read_text(encoding="utf-8"))
+
+    def test_whisper_and_docx_failures_are_counted(self) -> None:
+        for name in ["bad.wav", "broken.wav", "good.wav"]:
+            (self.input_dir / name).touch()
+
+        def fake_docx(*, txt_path: Path, docx_path: Path, title: str) -> None:
+            if txt_path.stem == "broken":
+                raise DocxConversionError("failed to write docx")
+            docx_path.touch()
+
+        with mock.patch("app.pipeline.txt_to_docx", side_effect=fake_docx):
+            with self.assertRaises(WhisperFailedError):
+                run_pipeline(replace(self.settings, output_format="docx"))
+
+        status = self._status()
+        self.assertEqual(status["state"], "failed")
+        self.assertEqual(status["files_total"], 3)
+        self.assertEqual(status["files_done"], 1)
+        self.assertEqual(status["files_failed"], 2)
+
+    def test_shared_stem_keeps_first_input(self) -> None:
+        for name in ["a.mp3", "a.wav"]:
+            (self.input_dir / name).touch()
+
+        run_pipeline(self.settings)
+
+        self.assertEqual(self.transcribed, ["a.mp3"])
+        self.assertEqual((self.settings.output_dir / "a.txt").read_text(encoding="utf-8"), "text from a.mp3")
+        status = self._status()
+        self.assertEqual(status["state"], "done")
+        self.assertEqual(status["files_total"], 1)
+
+    def test_unexpected_error_marks_status_aborted(self) -> None:
+        (self.input_dir / "a.wav").touch()
+
+        with mock.patch("app.pipeline.run_whisper_txt", side_effect=FileNotFoundError("whisper")):
+            with self.assertRaises(FileNotFoundError):
+                run_pipeline(self.settings)
+
+        status = self._status()
+        self.assertEqual(status["state"], "aborted")
+        self.assertEqual(status["current_file"], "a.wav")
+
+
+if __name__ == "__main__":
+    unittest.main()